@@ -1,11 +1,13 @@
 """This is the sphinx_matlab module"""
 
-from sphinx.application import Sphinx
+import typing as t
 
 __version__ = "0.1.0"
 
 
-def setup(app: Sphinx):
-    from .extension import setup as _setup
+def __getattr__(name: str) -> t.Any:
+    if name == "setup":
+        from .extension import setup
 
-    return _setup(app)
+        return setup
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
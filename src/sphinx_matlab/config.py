@@ -1,9 +1,8 @@
 import dataclasses as dc
+import functools
 import re
 import typing as t
 
-from autodoc2.config import _load_renderer
-
 if t.TYPE_CHECKING:
     from autodoc2.render.base import RendererBase
 
@@ -11,6 +10,13 @@ if t.TYPE_CHECKING:
 CONFIG_PREFIX = "matlab_"
 
 
+def _load_renderer(name: str, item: t.Any) -> type["RendererBase"]:
+    """Load a renderer class, importing autodoc2 only when first needed."""
+    from autodoc2.config import _load_renderer as _autodoc2_load_renderer
+
+    return _autodoc2_load_renderer(name, item)
+
+
 class ValidationError(Exception):
     """An error validating a config value."""
 
@@ -26,6 +32,12 @@ def _validate_hidden_objects(name: str, item: t.Any) -> set[str]:
     return value
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_regex(regex: str) -> t.Pattern[str]:
+    """Compile a regex, reusing the pattern across config reloads."""
+    return re.compile(regex)
+
+
 def _validate_list_tuple_regex_str(name: str, item: t.Any) -> list[tuple[t.Pattern[str], str]]:
     """Validate that an item is a list of (regex, str) tuples."""
     if not isinstance(item, list) or not all(
@@ -35,7 +47,7 @@ def _validate_list_tuple_regex_str(name: str, item: t.Any) -> list[tuple[t.Patte
     compiled = []
     for i, (regex, replacement) in enumerate(item):
         try:
-            compiled.append((re.compile(regex), replacement))
+            compiled.append((_compile_regex(regex), replacement))
         except re.error as exc:
             raise ValidationError(f"{name}[{i}] is not a valid regex: {exc}") from exc
     return compiled
@@ -64,7 +76,7 @@ class Config:
         },
     )
 
-    render_plugin: type[RendererBase] = dc.field(
+    render_plugin: type["RendererBase"] = dc.field(
         default_factory=(lambda: _load_renderer("render_plugin", "rst")),
         metadata={
             "help": (
@@ -187,8 +199,16 @@ class Config:
         },
     )
 
+    _FIELDS: t.ClassVar[tuple[dc.Field, ...]] = ()  # type: ignore[type-arg]
+
+    @classmethod
+    def _fields(cls) -> tuple[dc.Field, ...]:  # type: ignore[type-arg]
+        """Return the dataclass fields, computed once per class."""
+        if "_FIELDS" not in cls.__dict__ or not cls._FIELDS:
+            cls._FIELDS = dc.fields(cls)
+        return cls._FIELDS
+
     def as_triple(self) -> t.Iterable[tuple[str, t.Any, dc.Field]]:  # type: ignore[type-arg]
         """Yield triples of (name, value, field)."""
-        fields = {f.name: f for f in dc.fields(self.__class__)}
-        for name, value in dc.asdict(self).items():
-            yield name, value, fields[name]
+        for f in self._fields():
+            yield f.name, getattr(self, f.name), f
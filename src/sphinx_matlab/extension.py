@@ -1,3 +1,4 @@
+import dataclasses as dc
 import typing as t
 
 from sphinx.application import Sphinx
@@ -6,24 +7,38 @@ from . import __version__
 from .config import CONFIG_PREFIX, Config
 
 
+def _sphinx_default(field: dc.Field) -> t.Any:  # type: ignore[type-arg]
+    """Return the default value to register with Sphinx for a config field."""
+    if "sphinx_default" in field.metadata:
+        return field.metadata["sphinx_default"]
+    if field.default is not dc.MISSING:
+        return field.default
+    return field.default_factory()  # type: ignore[misc]
+
+
+def _sphinx_types(field: dc.Field) -> t.Any:  # type: ignore[type-arg]
+    """Return the types to register with Sphinx for a config field."""
+    sphinx_type = field.metadata.get("sphinx_type", t.Any)
+    if sphinx_type in (str, int, float, bool, list):
+        return (sphinx_type,)
+    return sphinx_type
+
+
+_REGISTRATIONS: tuple[tuple[str, t.Any, t.Any], ...] = tuple(
+    (f"{CONFIG_PREFIX}{field.name}", _sphinx_default(field), _sphinx_types(field))
+    for field in dc.fields(Config)
+)
+
+
 def setup(app: Sphinx):
-    for name, default, field in Config().as_triple():
-        sphinx_type = t.Any
-        if "sphinx_type" in field.metadata:
-            sphinx_type = field.metadata["sphinx_type"]
-            if sphinx_type in (str, int, float, bool, list):
-                sphinx_type = (sphinx_type,)
-        app.add_config_value(
-            f"{CONFIG_PREFIX}{name}",
-            field.metadata.get("sphinx_default", default),
-            "env",
-            types=sphinx_type,
-        )
+    for name, default, types in _REGISTRATIONS:
+        app.add_config_value(name, default, "env", types=types)
 
     app.connect("builder-inited", create_namespace_from_path)
     return {
         "version": __version__,
         # "env_version": "hash_based_on_filetree",
+        "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
 